@@ -1,3 +1,17 @@
-from .inventory import Inventory
+from __future__ import annotations
 
-__all__ = ["Inventory"]
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .inventory import CachePolicy, Inventory, list_repos_batch
+
+__all__ = ["CachePolicy", "Inventory", "list_repos_batch"]
+
+
+def __getattr__(name: str):
+    # Defer importing Polars and PyGithub until the API is first used
+    if name in __all__:
+        from . import inventory
+
+        return getattr(inventory, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
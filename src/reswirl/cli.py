@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import sys
 import click
-from .inventory import Inventory
 
 
 @click.command()
-@click.argument("username", type=str)
+@click.argument("usernames", nargs=-1, required=True, type=str)
 @click.option(
     "--format",
     "-f",
@@ -14,14 +13,32 @@ from .inventory import Inventory
     default="table",
     help="Output format: table, csv, or json.",
 )
-def main(username: str, output_format: str) -> None:
+@click.option(
+    "--head",
+    "-n",
+    "head",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Only output the first N repositories.",
+)
+def main(usernames: tuple[str, ...], output_format: str, head: int | None) -> None:
     """
-    Command-line interface for igloosphinx.
-    Retrieves `objects.inv` data for a PACKAGE_NAME, then outputs it in the requested format.
+    Command-line interface for reswirl.
+    Lists the public repositories of the GitHub user(s) USERNAMES, then outputs them in the requested format.
+    Several users are fetched concurrently, and their repositories labelled by 'owner'.
     """
-    inventory = Inventory(username=username)
+    # Imported here so that --help and usage errors don't pay for Polars and PyGithub
+    from .inventory import Inventory, list_repos_batch
+
     try:
-        df = inventory.fetch_inventory()
+        if len(usernames) == 1:
+            repos = Inventory(username=usernames[0], lazy=True).list_repos()
+        else:
+            repos = list_repos_batch(usernames, lazy=True)
+        # Slice before collecting so the limit is pushed down into the query
+        if head is not None:
+            repos = repos.head(head)
+        df = repos.collect()
     except Exception as exc:
         click.echo(f"Error: {exc}", err=True)
         sys.exit(1)
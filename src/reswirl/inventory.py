@@ -1,15 +1,175 @@
 # src/reswirl/inventory.py
 from __future__ import annotations
 
+import json
 import os
+import re
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import polars as pl
-from github import Github
 from platformdirs import user_cache_dir
-from upath import UPath
+
+if TYPE_CHECKING:
+    from github import Github
 
 ENV_GH_TOKEN = os.getenv("GITHUB_TOKEN")
+MAX_WORKERS = 16
+# GitHub's maximum page size, rather than PyGithub's default of 30
+GITHUB_PER_PAGE = 100
+USER_AGENT = "reswirl"
+REPOS_SCHEMA = {
+    "name": pl.String,
+    "default_branch": pl.String,
+    "description": pl.String,
+    "archived": pl.Boolean,
+    "is_fork": pl.Boolean,
+    "issues": pl.UInt32,
+    "stars": pl.UInt32,
+    "forks": pl.UInt32,
+    "size": pl.UInt32,
+}
+# Per-repository frames name their repository as a string: a categorical is only cast
+# once all the frames have been combined, so they all share a single encoding
+FILE_TREE_SCHEMA = {
+    "repository_name": pl.String,
+    "file_path": pl.String,
+    "is_directory": pl.Boolean,
+    "file_size_bytes": pl.Int64,
+}
+
+
+_thread_clients = threading.local()
+
+
+def _github_client(token: str | None) -> Github:
+    """
+    Return the calling thread's PyGithub client for this token, creating it once.
+
+    PyGithub keeps a single pooled `requests.Session` per client, so reusing the
+    client means repeated (or batched) inventories reuse the open HTTPS connection
+    to the GitHub API instead of paying a fresh TCP+TLS handshake each time.
+    Clients are per thread because a client's `Requester` sends every request through
+    one persistent connection object, which interleaved threads would corrupt.
+    """
+    clients = _thread_clients.__dict__.setdefault("by_token", {})
+    if token not in clients:
+        # PyGithub is slow to import, and replaying the cache never needs it
+        from github import Auth, Github
+
+        auth = Auth.Token(token) if token else None
+        clients[token] = Github(
+            auth=auth,
+            user_agent=USER_AGENT,
+            per_page=GITHUB_PER_PAGE,
+        )
+    return clients[token]
+
+
+def _glob_regex(pattern: str) -> str:
+    """
+    Translate a glob pattern to a regex matching whole repo-relative paths, where `*`,
+    `?` and `[...]` (or `[!...]`) classes stay within one path segment and `**` spans
+    any number of segments. Only characters special to Polars' (Rust) regex syntax
+    are escaped.
+    """
+    regex = ["^"]
+    # A class's first member may be `]`, and a `[` with no closing `]` is literal
+    for token in re.split(r"(\*\*/?|\*|\?|\[!?+\]?+[^\]]*\])", pattern.lstrip("/")):
+        if token == "**/":
+            regex.append("(?:.*/)?")
+        elif token == "**":
+            regex.append(".*")
+        elif token == "*":
+            regex.append("[^/]*")
+        elif token == "?":
+            regex.append("[^/]")
+        elif token.startswith("[") and token.endswith("]") and len(token) > 2:
+            negate = token[1] == "!"
+            members = _glob_class_members(token[2 if negate else 1 : -1])
+            if negate:
+                regex.append(f"[^/{members}]")
+            else:
+                # A class whose only ranges were reversed matches nothing
+                regex.append(f"[{members}]" if members else r"[^\s\S]")
+        elif token:
+            regex.append(re.sub(r"([\\.+*?()|\[\]{}^$#&\-~])", r"\\\1", token))
+    regex.append("$")
+    return "".join(regex)
+
+
+def _glob_class_members(members: str) -> str:
+    """
+    Translate the members of a glob `[...]` class to those of a regex class, reading
+    ranges left to right as `fnmatch` does: a `-` is literal unless it joins two
+    characters, so `[a-c-e]` matches `a`-`c`, `-` and `e`, and a reversed range (like
+    the `a--` in `[a--c]`) is dropped. Characters special within a regex class are
+    escaped, so a doubled `-` (or `&&`, `~~`) is never read as a Rust set operation.
+    """
+
+    def escape(char: str) -> str:
+        return f"\\{char}" if char in "\\[]&~^-" else char
+
+    escaped = []
+    i = 0
+    while i < len(members):
+        if i + 2 < len(members) and members[i + 1] == "-":
+            low, high = members[i], members[i + 2]
+            if low <= high:
+                escaped.append(f"{escape(low)}-{escape(high)}")
+            i += 3
+        else:
+            escaped.append(escape(members[i]))
+            i += 1
+    return "".join(escaped)
+
+
+def _file_tree_frame(
+    repo_name: str,
+    file_paths: list[str],
+    is_dirs: list[bool],
+    file_sizes: list[int],
+) -> pl.DataFrame:
+    """
+    Assemble one repository's file listing from its columns.
+    """
+    return pl.DataFrame(
+        {
+            "repository_name": [repo_name] * len(file_paths),
+            "file_path": file_paths,
+            "is_directory": is_dirs,
+            "file_size_bytes": file_sizes,
+        },
+        schema=FILE_TREE_SCHEMA,
+    )
+
+
+def _filter_expr(filter_: str | pl.Expr) -> pl.Expr:
+    """
+    A filter given as a column name keeps the rows where that column is True.
+    """
+    return pl.col(filter_) if isinstance(filter_, str) else filter_
+
+
+class CachePolicy(StrEnum):
+    """
+    How an Inventory uses its on-disk cache of the repository listing and trees.
+
+    - ENABLED: serve the cache while GitHub confirms (by ETag) it is still current.
+    - REPLAY: serve the cache only, never contacting GitHub.
+    - DISABLED: always fetch from GitHub, never reading or writing the cache.
+    - REFRESH: always fetch from GitHub and overwrite the cache.
+    """
+
+    ENABLED = "enabled"
+    REPLAY = "replay"
+    DISABLED = "disabled"
+    REFRESH = "refresh"
 
 
 class Inventory:
@@ -27,122 +187,265 @@ class Inventory:
         force_refresh: bool = False,
         repo_filter: str | pl.Expr | None = None,
         tree_filter: str | pl.Expr | None = None,
+        cache_policy: CachePolicy | str | None = None,
     ) -> None:
         """
         Initialise the Inventory object.
 
         Args:
             username: The GitHub username to fetch repositories for.
-            lazy: Whether to allow lazy Polars operations (not all transformations may be supported).
+            lazy: Whether to return LazyFrames (not all transformations may be supported).
             token: An optional GitHub personal access token for higher rate limits.
-            use_cache: Whether to use cached results if available.
-            force_refresh: If True, always refetch from GitHub and overwrite the cache.
+            use_cache: Whether to use cached results if available
+                       (shorthand for `cache_policy="disabled"` when False).
+            force_refresh: If True, always refetch from GitHub and overwrite the cache
+                           (shorthand for `cache_policy="refresh"`).
             repo_filter: Either a Polars schema (column) name to filter (where True),
                          or an Expr to filter the repository listing in `list_repos`.
             tree_filter: Either a Polars schema (column) name to filter (where True),
                          or an Expr to filter the repository tree in `walk_file_trees`.
+            cache_policy: How to use the local cache (see `CachePolicy`). If None,
+                          derived from `use_cache` and `force_refresh`.
         """
         self.username = username
         self.lazy = lazy
         self.token = token if token is not None else ENV_GH_TOKEN
         self.use_cache = use_cache
         self.force_refresh = force_refresh
-        self._inventory_df: pl.DataFrame | None = None
+        self.repo_filter = repo_filter
+        self.tree_filter = tree_filter
+        if cache_policy is None:
+            if not use_cache:
+                cache_policy = CachePolicy.DISABLED
+            elif force_refresh:
+                cache_policy = CachePolicy.REFRESH
+            else:
+                cache_policy = CachePolicy.ENABLED
+        self.cache_policy = CachePolicy(cache_policy)
+        self._inventory_df: pl.DataFrame | pl.LazyFrame | None = None
 
         # Initialize the cache location
         self._cache_dir = Path(user_cache_dir(appname="reswirl"))
         self._cache_dir.mkdir(exist_ok=True)
-        self._cache_file = self._cache_dir / f"{username}_repos.json"
+        self._cache_file = self._cache_dir / f"{username}_repos.parquet"
+        self._etag_file = self._cache_dir / f"{username}_repos.etag"
 
-    def list_repos(self) -> pl.DataFrame:
+    def list_repos(self) -> pl.DataFrame | pl.LazyFrame:
         """
         Fetches and parses the public repositories for the specified GitHub user.
         Checks the local cache first (unless force_refresh=True).
-        Returns a Polars DataFrame with columns such as 'name', 'html_url', and 'description'.
+        Returns a Polars DataFrame with columns such as 'name', 'html_url', and 'description',
+        or a LazyFrame if lazy=True, so that downstream operations are optimised
+        together with the `repo_filter` before anything is collected.
         """
         # 1. Retrieve the user’s repos (cached or fresh)
-        self._inventory_df = self._retrieve_repos()
+        repos = self._retrieve_repos().lazy()
+        # 2. Restrict to the repos of interest
+        if self.repo_filter is not None:
+            repos = repos.filter(_filter_expr(self.repo_filter))
+        self._inventory_df = repos if self.lazy else repos.collect()
         return self._inventory_df
 
     def review_version_changes(
         self,
         from_v: str = "first",
         to_v: str = "latest",
-    ) -> pl.DataFrame:
+    ) -> pl.DataFrame | pl.LazyFrame:
         """
-        Compare repository metadata across two versions (placeholder).
-        Currently returns a trivial DataFrame.
+        Compare repository metadata across two versions of the listing, where "first"
+        is the locally cached listing and "latest" is fetched live from GitHub (without
+        overwriting the cache).
+
+        Returns one row per repository that was added, removed or changed, with its
+        'change' and the "_from" and "_to" values of every other column,
+        or a LazyFrame if lazy=True.
         """
-        return pl.DataFrame({"from_v": [from_v], "to_v": [to_v]})
+        lf_from = self._listing_version(from_v)
+        lf_to = self._listing_version(to_v)
+        from_columns = lf_from.collect_schema().names()
+        compared = [
+            c
+            for c in lf_to.collect_schema().names()
+            if c in from_columns and c != "name"
+        ]
+        # Mark which side each repo came from, as the full join nulls out the other
+        lf_from = lf_from.select(
+            "name",
+            *(pl.col(c).name.suffix("_from") for c in compared),
+            _in_from=pl.lit(True),
+        )
+        lf_to = lf_to.select(
+            "name",
+            *(pl.col(c).name.suffix("_to") for c in compared),
+            _in_to=pl.lit(True),
+        )
+        is_changed = pl.any_horizontal(
+            pl.col(f"{c}_from").ne_missing(pl.col(f"{c}_to")) for c in compared
+        )
+        change = (
+            pl.when(pl.col("_in_from").is_null())
+            .then(pl.lit("added"))
+            .when(pl.col("_in_to").is_null())
+            .then(pl.lit("removed"))
+            .when(is_changed)
+            .then(pl.lit("changed"))
+        )
+        # One plan for both versions and the join, collected (at most) once
+        diff = (
+            lf_from.join(lf_to, on="name", how="full", coalesce=True)
+            .with_columns(change=change)
+            .filter(pl.col("change").is_not_null())
+            .select(
+                "name",
+                "change",
+                *(f"{c}_{side}" for c in compared for side in ("from", "to")),
+            )
+            .sort("name")
+        )
+        return diff if self.lazy else diff.collect()
 
-    def _retrieve_repos(self) -> pl.DataFrame:
+    def _listing_version(self, version: str) -> pl.LazyFrame:
         """
-        Tries to use cached results if use_cache=True (and not force_refresh).
-        Otherwise, fetches from GitHub and caches the JSON if successful.
+        The repository listing at a version: "first" (cached) or "latest" (live).
         """
-        # If using cache and not forcing a refresh, try reading from file
-        if self.use_cache and not self.force_refresh:
+        if version == "first":
             cached_data = self._read_cache()
-            if cached_data is not None:
-                return cached_data
+            if cached_data is None:
+                raise FileNotFoundError(f"No cached repositories at {self._cache_file}")
+            return cached_data.lazy()
+        elif version == "latest":
+            repos_data, _ = self._fetch_from_github()
+            return repos_data.lazy()
+        raise ValueError(f"Unknown version {version!r}: expected 'first' or 'latest'")
 
-        # Otherwise, fetch from GitHub
+    def _retrieve_repos(self) -> pl.DataFrame | pl.LazyFrame:
+        """
+        Serves the cache according to the cache policy: under ENABLED the cached
+        listing is revalidated with conditional requests, under REPLAY it is used as-is.
+        Otherwise (or if stale), fetches from GitHub and caches the listing if successful.
+        """
+        if self.cache_policy is CachePolicy.REPLAY:
+            cached_data = self._read_cache()
+            if cached_data is None:
+                raise FileNotFoundError(f"No cached repositories at {self._cache_file}")
+            return cached_data
+
+        cached_data = None
+        if self.cache_policy is CachePolicy.ENABLED:
+            cached_data = self._read_cache()
         try:
-            repos_data = self._fetch_from_github()
-            # Cache the data
-            self._write_cache(repos_data)
+            # A 304 on every page means the cache is identical to a fresh fetch
+            if cached_data is not None and self._cache_is_current(cached_data):
+                return cached_data
+            repos_data, etags = self._fetch_from_github()
+            if self.cache_policy is not CachePolicy.DISABLED:
+                self._write_cache(repos_data, etags)
             return repos_data
         except Exception as e:
             # If something goes wrong with GitHub fetching, fallback to cache if it exists
-            cached_data = self._read_cache()
-            if cached_data is not None:
-                print(f"GitHub fetch failed ({e}), returning cached data.")
-                return cached_data
+            if self.cache_policy is not CachePolicy.DISABLED:
+                cached_data = self._read_cache()
+                if cached_data is not None:
+                    print(f"GitHub fetch failed ({e}), returning cached data.")
+                    return cached_data
             raise  # or handle this more gracefully in real usage
 
-    def _fetch_from_github(self) -> pl.DataFrame:
+    def _cache_is_current(self, cached_data: pl.DataFrame | pl.LazyFrame) -> bool:
+        """
+        Revalidate the cached listing by re-requesting each page it was built from
+        with `If-None-Match`. GitHub answers 304 (with no body, and without counting
+        against the rate limit) for every page whose content is unchanged.
+        """
+        try:
+            etags = self._etag_file.read_text().split()
+        except OSError:
+            return False
+        if not etags:
+            return False
+        requester = _github_client(self.token).requester
+        url = f"/users/{self.username}/repos"
+        per_page = requester.per_page
+        for page, etag in enumerate(etags, start=1):
+            status, _, _ = requester.requestJson(
+                "GET",
+                url,
+                parameters={"per_page": per_page, "page": page},
+                headers={"If-None-Match": etag},
+            )
+            if status != 304:
+                return False
+        # A repo added after a full last page lands on a page we hold no ETag for
+        n_cached = cached_data.lazy().select(pl.len()).collect().item()
+        if n_cached == len(etags) * per_page:
+            _, _, body = requester.requestJson(
+                "GET",
+                url,
+                parameters={"per_page": per_page, "page": len(etags) + 1},
+            )
+            return not json.loads(body)
+        return True
+
+    def _fetch_from_github(self) -> tuple[pl.DataFrame, list[str]]:
         """
         Uses PyGithub to retrieve the user's public repositories.
+        Also returns the ETag of each page of the listing, for later revalidation.
         """
-        gh = Github(self.token) if self.token else Github()
+        gh = _github_client(self.token)
         user = gh.get_user(self.username)
         repos = user.get_repos()
 
-        data = [
-            {
-                "name": repo.name,
-                "default_branch": repo.default_branch,
-                "description": repo.description or "",
-                "archived": repo.archived,
-                "is_fork": repo.fork,
-                "issues": repo.open_issues,
-                "stars": repo.stargazers_count,
-                "forks": repo.forks_count,
-                "size": repo.size,
-            }
-            for repo in repos
-        ]
-        df = pl.DataFrame(data)
-        return df.lazy().collect() if self.lazy else df
+        etags: list[str] = []
+        # Build the columns directly as each page streams in, rather than a row per repo
+        columns: dict[str, list] = {column: [] for column in REPOS_SCHEMA}
+        for repo in repos:
+            # Each repo carries the response headers of the page it arrived on
+            if repo.etag and (not etags or etags[-1] != repo.etag):
+                etags.append(repo.etag)
+            columns["name"].append(repo.name)
+            columns["default_branch"].append(repo.default_branch)
+            columns["description"].append(repo.description or "")
+            columns["archived"].append(repo.archived)
+            columns["is_fork"].append(repo.fork)
+            columns["issues"].append(repo.open_issues)
+            columns["stars"].append(repo.stargazers_count)
+            columns["forks"].append(repo.forks_count)
+            columns["size"].append(repo.size)
+        if not etags:
+            # No repo arrived to carry the (empty) page's ETag, so ask for it directly
+            requester = gh.requester
+            headers, _ = requester.requestJsonAndCheck(
+                "GET",
+                f"/users/{self.username}/repos",
+                parameters={"per_page": requester.per_page},
+            )
+            if "etag" in headers:
+                etags.append(headers["etag"])
+        # An explicit schema skips type inference (and fixes the dtypes of an empty listing)
+        return pl.DataFrame(columns, schema=REPOS_SCHEMA), etags
 
-    def _read_cache(self) -> pl.DataFrame | None:
+    def _read_cache(self) -> pl.DataFrame | pl.LazyFrame | None:
         """
-        Attempt to read previously cached JSON data from disk.
+        Attempt to read previously cached Parquet data from disk. If lazy=True, the
+        file is scanned rather than read, so downstream filters push down into it.
         Returns None if no file or if something fails to load.
         """
         if not self._cache_file.is_file():
             return None
         try:
-            return pl.read_ndjson(self._cache_file)
-        except OSError:
+            cached = pl.scan_parquet(self._cache_file)
+            # Reads only the file's metadata, but fails early if it is unreadable
+            cached.collect_schema()
+            return cached if self.lazy else cached.collect()
+        except (OSError, pl.exceptions.PolarsError):
             return None
 
-    def _write_cache(self, data: pl.DataFrame) -> None:
+    def _write_cache(self, data: pl.DataFrame, etags: list[str]) -> None:
         """
-        Write JSON data to the cache file.
+        Write Parquet data to the cache file, and the page ETags alongside it.
         """
         try:
-            data.write_ndjson(self._cache_file)
+            data.write_parquet(self._cache_file, compression="zstd", statistics=True)
+            self._etag_file.write_text("\n".join(etags))
         except OSError as e:
             print(f"Failed to write to cache: {e}")
 
@@ -151,9 +454,10 @@ class Inventory:
         pattern: str = "**",
         no_recurse: bool = False,
         skip_larger_than_mb: int | None = None,
+        max_workers: int = MAX_WORKERS,
     ) -> pl.DataFrame:
         """
-        Walks (recursively enumerates) files in each repository via UPath,
+        Walks (recursively enumerates) files in each repository via the Git Trees API,
         discovering (but not reading) file paths that match a given glob pattern.
 
         Args:
@@ -161,18 +465,48 @@ class Inventory:
             no_recurse: If True, uses "*" (non-recursive) instead of the default "**".
             skip_larger_than_mb: If set, skip listing files larger than this many MB.
                                  By default, None (don't skip based on size).
+            max_workers: How many repositories to walk concurrently. Kept modest by
+                         default to stay clear of GitHub's secondary rate limits.
 
         Returns:
             A Polars DataFrame with columns:
-                - "Repository_Name": str
-                - "File_Path": str (the path in the GitHub “filesystem”)
-                - "Is_Directory": bool
-                - "File_Size_Bytes": int
+                - "repository_name": categorical
+                - "file_path": str (the path in the GitHub “filesystem”)
+                - "is_directory": bool
+                - "file_size_bytes": int
 
         Notes:
-            - **Slow** for large repos or wide patterns, as it enumerates all matches.
-            - If skip_larger_than_mb is set, we call `p.stat().st_size` for each file,
-              skipping ones that exceed that threshold.
+            - Takes one API call per repository, except for repos whose tree is too
+              large for GitHub to return in one response: these are walked via UPath,
+              which is **slow** as it makes API calls per directory and per file.
+            - Use `iter_file_trees` to process each repository as it is walked.
+        """
+        return pl.concat(
+            [
+                pl.DataFrame(schema=FILE_TREE_SCHEMA),
+                *self.iter_file_trees(
+                    pattern,
+                    no_recurse,
+                    skip_larger_than_mb,
+                    max_workers,
+                ),
+            ],
+            rechunk=True,
+        ).with_columns(pl.col("repository_name").cast(pl.Categorical))
+
+    def iter_file_trees(
+        self,
+        pattern: str = "**",
+        no_recurse: bool = False,
+        skip_larger_than_mb: int | None = None,
+        max_workers: int = MAX_WORKERS,
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Like `walk_file_trees`, but yields one DataFrame per repository (in listing
+        order) as soon as it has been walked, rather than holding every repository's
+        listing at once. Repositories are walked concurrently in a thread pool, with at
+        most `max_workers` walks in flight (or finished but not yet yielded).
+        Each frame's 'repository_name' is a string, not yet cast to categorical.
         """
         # Ensure we have a repo inventory
         if self._inventory_df is None:
@@ -180,38 +514,180 @@ class Inventory:
         # Adjust pattern if user wants a shallow (non-recursive) listing
         if no_recurse:
             pattern = "*"
-        records = []
-        for row in self._inventory_df.to_dicts():
-            repo_name = row["name"]
-            default_branch = row["default_branch"]
-            # Construct a GitHub UPath; note org=self.username for personal repos
-            ghpath = UPath(
-                "/",
-                protocol="github",
-                org=self.username,
-                repo=repo_name,
-                sha=default_branch,
-                username=self.username,  # used for BasicAuth
-                token=self.token,  # personal access token
+        # Built once for the whole walk, then applied to each repository's tree
+        predicates = [pl.col("file_path").str.contains(_glob_regex(pattern))]
+        if skip_larger_than_mb is not None:
+            threshold_bytes = skip_larger_than_mb * 1_048_576
+            predicates.append(
+                pl.col("is_directory") | pl.col("file_size_bytes").le(threshold_bytes),
             )
-            for p in ghpath.glob(pattern):
-                # Check if directory
-                if is_dir := p.is_dir():
-                    file_size_bytes = 0
-                else:
-                    # For skipping large files or just capturing size
-                    file_size_bytes = p.stat().st_size
-                    if skip_larger_than_mb is not None:
-                        threshold_bytes = skip_larger_than_mb * 1_048_576
-                        if file_size_bytes > threshold_bytes:
-                            # Skip this file
-                            continue
-                records.append(
-                    {
-                        "repository_name": repo_name,
-                        "file_path": os.path.join(*p.parts),
-                        "is_directory": is_dir,
-                        "file_size_bytes": file_size_bytes,
-                    },
+        if self.tree_filter is not None:
+            predicates.append(_filter_expr(self.tree_filter))
+        repos = self._inventory_df.lazy().select("name", "default_branch").collect()
+        repo_rows = repos.iter_rows()
+        # Each walk is bound by API round trips, so overlap them across repos, but only
+        # submit the next walk as each one is yielded so results don't pile up unread
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        in_flight = deque()
+        try:
+            for repo_name, default_branch in repo_rows:
+                in_flight.append(
+                    executor.submit(
+                        self._walk_repo,
+                        repo_name,
+                        default_branch,
+                        pattern,
+                        predicates,
+                    ),
                 )
-        return pl.DataFrame(records)
+                if len(in_flight) >= max_workers:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            # Don't go on to walk the remaining repos if the caller stops early
+            executor.shutdown(cancel_futures=True)
+
+    def _walk_repo(
+        self,
+        repo_name: str,
+        default_branch: str,
+        pattern: str,
+        predicates: list[pl.Expr],
+    ) -> pl.DataFrame:
+        """
+        Walk a single repository's file tree at its default branch, keeping the entries
+        that satisfy all of the predicates.
+
+        The whole tree (every path with its type and size) comes from a single Git Trees
+        API call, rather than a glob making API calls per directory and per file stat.
+        """
+        files = self._retrieve_tree(repo_name, default_branch)
+        if files is None:
+            # Too many entries for one response: fall back to walking via UPath
+            files = self._glob_repo(repo_name, default_branch, pattern)
+        # Filter the whole listing at once with expressions, not file by file
+        return files.filter(*predicates)
+
+    def _retrieve_tree(self, repo_name: str, tree_sha: str) -> pl.DataFrame | None:
+        """
+        Fetch a repository's full (unfiltered) tree, caching it according to the cache
+        policy. Under ENABLED a cached tree is revalidated with its ETag, so an unchanged
+        repo costs a 304 response with no body (which doesn't count against the rate limit).
+        Unless DISABLED, a failed request falls back to the cached tree if there is one.
+        Returns None if the tree is too large for GitHub to return in one response.
+        """
+        cache_file = self._cache_dir / f"{self.username}_{repo_name}_tree.parquet"
+        etag_file = cache_file.with_suffix(".etag")
+        if self.cache_policy is CachePolicy.REPLAY:
+            try:
+                return pl.read_parquet(cache_file)
+            except OSError:
+                raise FileNotFoundError(f"No cached tree at {cache_file}") from None
+
+        headers = {}
+        if self.cache_policy is CachePolicy.ENABLED and cache_file.is_file():
+            try:
+                headers["If-None-Match"] = etag_file.read_text()
+            except OSError:
+                pass
+        requester = _github_client(self.token).requester
+        try:
+            response_headers, data = requester.requestJsonAndCheck(
+                "GET",
+                f"/repos/{self.username}/{repo_name}/git/trees/{tree_sha}",
+                parameters={"recursive": 1},
+                headers=headers,
+            )
+        except Exception as e:
+            # As for the listing, fall back to the cached tree if one exists
+            if self.cache_policy is not CachePolicy.DISABLED and cache_file.is_file():
+                print(f"GitHub fetch failed ({e}), returning cached tree.")
+                return pl.read_parquet(cache_file)
+            raise
+        if data is None:
+            # 304 Not Modified: the cached tree is still current
+            return pl.read_parquet(cache_file)
+        if data["truncated"]:
+            return None
+        elements = data["tree"]
+        files = _file_tree_frame(
+            repo_name,
+            [element["path"] for element in elements],
+            [element["type"] == "tree" for element in elements],
+            [element.get("size", 0) for element in elements],
+        )
+        if self.cache_policy is not CachePolicy.DISABLED and "etag" in response_headers:
+            try:
+                files.write_parquet(cache_file, compression="zstd")
+                etag_file.write_text(response_headers["etag"])
+            except OSError as e:
+                print(f"Failed to write to cache: {e}")
+        return files
+
+    def _glob_repo(
+        self,
+        repo_name: str,
+        default_branch: str,
+        pattern: str,
+    ) -> pl.DataFrame:
+        """
+        List a repository's paths matching the glob pattern via UPath.
+        Slow: this makes API calls per directory and per file.
+        """
+        from upath import UPath
+
+        # Construct a GitHub UPath; note org=self.username for personal repos
+        ghpath = UPath(
+            "/",
+            protocol="github",
+            org=self.username,
+            repo=repo_name,
+            sha=default_branch,
+            username=self.username,  # used for BasicAuth
+            token=self.token,  # personal access token
+        )
+        # Build the columns directly, rather than a dict per file for Polars to transpose
+        file_paths: list[str] = []
+        is_dirs: list[bool] = []
+        file_sizes: list[int] = []
+        for p in ghpath.glob(pattern):
+            # Check if directory
+            if is_dir := p.is_dir():
+                file_size_bytes = 0
+            else:
+                file_size_bytes = p.stat().st_size
+            # The bare repo-relative path (as_posix() would keep the "github://" prefix)
+            file_paths.append(p.path)
+            is_dirs.append(is_dir)
+            file_sizes.append(file_size_bytes)
+        return _file_tree_frame(repo_name, file_paths, is_dirs, file_sizes)
+
+
+def list_repos_batch(
+    usernames: Iterable[str],
+    max_workers: int = MAX_WORKERS,
+    **inventory_kwargs,
+) -> pl.DataFrame | pl.LazyFrame:
+    """
+    List the public repositories of several GitHub users at once, fetching (or
+    revalidating the cache of) each user's listing concurrently, with each worker
+    thread keeping its own GitHub connection. Keyword arguments are passed on to each
+    `Inventory`.
+
+    Returns the listings concatenated, with each repository's user in a leading
+    'owner' column, or a LazyFrame if lazy=True.
+    """
+    inventories = [Inventory(username, **inventory_kwargs) for username in usernames]
+    if not inventories:
+        raise ValueError("No usernames given")
+    # Each listing is bound by API round trips, so overlap them across users
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        listings = list(executor.map(Inventory.list_repos, inventories))
+    repos = pl.concat(
+        [
+            listing.lazy().select(pl.lit(inventory.username).alias("owner"), pl.all())
+            for inventory, listing in zip(inventories, listings)
+        ],
+    )
+    return repos if inventories[0].lazy else repos.collect()
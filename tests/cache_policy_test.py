@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+import polars as pl
+import pytest
+
+import reswirl.inventory
+from reswirl import CachePolicy, Inventory
+
+REPOS = pl.DataFrame({"name": ["a", "b"], "default_branch": ["main", "main"]})
+
+
+class StubRequester:
+    """Answers every conditional request with the given status."""
+
+    per_page = 30
+
+    def __init__(self, status: int) -> None:
+        self.status = status
+        self.calls = []
+
+    def requestJson(self, verb, url, parameters=None, headers=None):
+        self.calls.append((parameters, headers))
+        return self.status, {}, "[]"
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Stub the GitHub fetch, recording each call."""
+    calls = []
+
+    def fetch(self):
+        calls.append(self.username)
+        return REPOS, ['W/"page1"']
+
+    monkeypatch.setattr(Inventory, "_fetch_from_github", fetch)
+    return calls
+
+
+def use_requester(monkeypatch, requester):
+    client = SimpleNamespace(requester=requester)
+    monkeypatch.setattr(reswirl.inventory, "_github_client", lambda token: client)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "policy"),
+    [
+        ({}, CachePolicy.ENABLED),
+        ({"use_cache": False}, CachePolicy.DISABLED),
+        ({"force_refresh": True}, CachePolicy.REFRESH),
+        ({"use_cache": False, "force_refresh": True}, CachePolicy.DISABLED),
+        ({"force_refresh": True, "cache_policy": "replay"}, CachePolicy.REPLAY),
+    ],
+)
+def test_cache_policy_from_flags(kwargs, policy):
+    assert Inventory("user", **kwargs).cache_policy is policy
+
+
+def test_not_modified_serves_cache(fetches, monkeypatch):
+    Inventory("user", cache_policy="refresh").list_repos()
+    requester = StubRequester(304)
+    use_requester(monkeypatch, requester)
+    assert Inventory("user").list_repos().equals(REPOS)
+    assert fetches == ["user"]
+    assert requester.calls == [
+        ({"per_page": 30, "page": 1}, {"If-None-Match": 'W/"page1"'}),
+    ]
+
+
+def test_modified_refetches(fetches, monkeypatch):
+    Inventory("user", cache_policy="refresh").list_repos()
+    use_requester(monkeypatch, StubRequester(200))
+    Inventory("user").list_repos()
+    assert fetches == ["user", "user"]
+
+
+def test_replay_without_cache_raises(fetches):
+    with pytest.raises(FileNotFoundError):
+        Inventory("user", cache_policy="replay").list_repos()
+    assert fetches == []
+
+
+def test_disabled_writes_no_cache(fetches, cache_dir):
+    Inventory("user", use_cache=False).list_repos()
+    assert list(cache_dir.iterdir()) == []
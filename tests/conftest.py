@@ -0,0 +1,10 @@
+import pytest
+
+import reswirl.inventory
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep every Inventory's cache in a temporary directory."""
+    monkeypatch.setattr(reswirl.inventory, "user_cache_dir", lambda appname: tmp_path)
+    return tmp_path
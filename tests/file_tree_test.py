@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+
+import polars as pl
+import pytest
+
+import reswirl.inventory
+from reswirl import Inventory
+from reswirl.inventory import _file_tree_frame, _glob_regex
+
+TREE = {
+    "truncated": False,
+    "tree": [
+        {"path": "src", "type": "tree"},
+        {"path": "src/a.py", "type": "blob", "size": 10},
+    ],
+}
+FILES = _file_tree_frame("repo", ["src", "src/a.py"], [True, False], [0, 10])
+
+
+class StubRequester:
+    """Answers each tree request with the next response, raising it if an error."""
+
+    def __init__(self, *responses) -> None:
+        self.responses = list(responses)
+        self.calls = []
+
+    def requestJsonAndCheck(self, verb, url, parameters=None, headers=None):
+        self.calls.append(headers)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def requester(monkeypatch):
+    def use(*responses):
+        stub = StubRequester(*responses)
+        client = SimpleNamespace(requester=stub)
+        monkeypatch.setattr(reswirl.inventory, "_github_client", lambda token: client)
+        return stub
+
+    return use
+
+
+def walk(inventory, *predicates):
+    # Every walk filters by its glob pattern, as `iter_file_trees` builds it
+    glob = pl.col("file_path").str.contains(_glob_regex("**"))
+    return inventory._walk_repo("repo", "main", "**", [glob, *predicates])
+
+
+def test_tree_types_map_to_is_directory(requester):
+    requester(({}, TREE))
+    assert walk(Inventory("user", use_cache=False)).equals(FILES)
+
+
+def test_walk_applies_predicates(requester):
+    requester(({}, TREE))
+    files = walk(Inventory("user", use_cache=False), ~pl.col("is_directory"))
+    assert files["file_path"].to_list() == ["src/a.py"]
+
+
+def test_not_modified_serves_cached_tree(requester):
+    requester(({"etag": 'W/"tree1"'}, TREE))
+    walk(Inventory("user"))
+    stub = requester(({}, None))
+    assert walk(Inventory("user")).equals(FILES)
+    assert stub.calls == [{"If-None-Match": 'W/"tree1"'}]
+
+
+def test_truncated_tree_falls_back_to_glob(requester, monkeypatch):
+    requester(({}, {"truncated": True, "tree": []}))
+    globs = []
+
+    def glob_repo(self, repo_name, default_branch, pattern):
+        globs.append((repo_name, default_branch, pattern))
+        return FILES
+
+    monkeypatch.setattr(Inventory, "_glob_repo", glob_repo)
+    assert walk(Inventory("user", use_cache=False)).equals(FILES)
+    assert globs == [("repo", "main", "**")]
+
+
+def test_replay_without_cached_tree_raises(requester):
+    stub = requester()
+    with pytest.raises(FileNotFoundError):
+        walk(Inventory("user", cache_policy="replay"))
+    assert stub.calls == []
+
+
+def test_disabled_writes_no_cached_tree(requester, cache_dir):
+    requester(({"etag": 'W/"tree1"'}, TREE))
+    walk(Inventory("user", use_cache=False))
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_failed_request_falls_back_to_cached_tree(requester):
+    requester(({"etag": 'W/"tree1"'}, TREE))
+    walk(Inventory("user"))
+    requester(ConnectionError("offline"))
+    assert walk(Inventory("user")).equals(FILES)
+
+
+def test_failed_request_without_cached_tree_raises(requester):
+    requester(ConnectionError("offline"))
+    with pytest.raises(ConnectionError):
+        walk(Inventory("user"))
@@ -0,0 +1,23 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from reswirl.inventory import _github_client
+
+
+def test_client_reused_within_a_thread():
+    assert _github_client("t") is _github_client("t")
+    assert _github_client("t") is not _github_client(None)
+
+
+def test_each_thread_gets_its_own_client():
+    # Hold every worker until all have started, so each call runs on its own thread
+    barrier = threading.Barrier(4)
+
+    def client(_):
+        barrier.wait()
+        return _github_client("t")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(client, range(4)))
+    assert len({id(c) for c in clients}) == 4
+    assert _github_client("t") not in clients
@@ -0,0 +1,52 @@
+import polars as pl
+import pytest
+
+from reswirl.inventory import _glob_regex
+
+PATHS = [
+    "README.md",
+    "src",
+    "src/a.py",
+    "src/b.py",
+    "src/c.py",
+    "src/].py",
+    "src/[.py",
+    "src/pkg/d.py",
+    "docs/a+b (1).md",
+]
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("**", PATHS),
+        ("*", ["README.md", "src"]),
+        ("/*.md", ["README.md"]),
+        ("src/*.py", ["src/a.py", "src/b.py", "src/c.py", "src/].py", "src/[.py"]),
+        (
+            "**/*.py",
+            [
+                "src/a.py",
+                "src/b.py",
+                "src/c.py",
+                "src/].py",
+                "src/[.py",
+                "src/pkg/d.py",
+            ],
+        ),
+        ("src/?.py", ["src/a.py", "src/b.py", "src/c.py", "src/].py", "src/[.py"]),
+        ("src/[ab].py", ["src/a.py", "src/b.py"]),
+        ("src/[a-b].py", ["src/a.py", "src/b.py"]),
+        ("src/[!ab].py", ["src/c.py", "src/].py", "src/[.py"]),
+        ("src/[]a].py", ["src/a.py", "src/].py"]),
+        ("src/[!]a].py", ["src/b.py", "src/c.py", "src/[.py"]),
+        # Ranges read left to right, so the reversed `a--` is dropped, as in fnmatch
+        ("src/[a--c].py", ["src/c.py"]),
+        ("src/[a&&b].py", ["src/a.py", "src/b.py"]),
+        ("src/[.py", ["src/[.py"]),
+        ("docs/a+b (1).md", ["docs/a+b (1).md"]),
+    ],
+)
+def test_glob_regex_matches(pattern, expected):
+    paths = pl.Series(PATHS)
+    assert paths.filter(paths.str.contains(_glob_regex(pattern))).to_list() == expected
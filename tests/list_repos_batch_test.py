@@ -0,0 +1,40 @@
+import polars as pl
+import pytest
+
+from reswirl import Inventory, list_repos_batch
+
+
+@pytest.fixture(autouse=True)
+def fetches(monkeypatch):
+    """Stub the GitHub fetch with one repository named after each user."""
+
+    def fetch(self):
+        repos = pl.DataFrame(
+            {"name": [f"{self.username}-repo"], "default_branch": ["main"]},
+        )
+        return repos, ['W/"page1"']
+
+    monkeypatch.setattr(Inventory, "_fetch_from_github", fetch)
+
+
+def test_owner_column_names_each_user():
+    repos = list_repos_batch(["alice", "bob"], use_cache=False)
+    assert repos.columns[0] == "owner"
+    assert repos.select("owner", "name").rows() == [
+        ("alice", "alice-repo"),
+        ("bob", "bob-repo"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("lazy", "frame_type"),
+    [(True, pl.LazyFrame), (False, pl.DataFrame)],
+)
+def test_lazy_result_type(lazy, frame_type):
+    repos = list_repos_batch(["alice", "bob"], lazy=lazy, use_cache=False)
+    assert isinstance(repos, frame_type)
+
+
+def test_no_usernames_raises():
+    with pytest.raises(ValueError, match="No usernames given"):
+        list_repos_batch([])
@@ -0,0 +1,70 @@
+import polars as pl
+import pytest
+
+from reswirl import Inventory
+
+CACHED = pl.DataFrame(
+    {
+        "name": ["kept", "removed", "edited"],
+        "default_branch": ["main", "main", "main"],
+        "stars": [1, 2, 3],
+        "description": ["same", None, "old"],
+    },
+)
+LIVE = pl.DataFrame(
+    {
+        "name": ["added", "edited", "kept"],
+        "default_branch": ["main", "main", "main"],
+        "stars": [0, 3, 1],
+        "description": ["new", "new", "same"],
+    },
+)
+
+
+def stub_fetch(monkeypatch, repos: pl.DataFrame) -> None:
+    monkeypatch.setattr(Inventory, "_fetch_from_github", lambda self: (repos, []))
+
+
+@pytest.fixture
+def cached(monkeypatch):
+    """Cache CACHED as the 'first' listing, then serve LIVE as the 'latest'."""
+    stub_fetch(monkeypatch, CACHED)
+    Inventory("user", cache_policy="refresh").list_repos()
+    stub_fetch(monkeypatch, LIVE)
+
+
+def test_changes_are_classified(cached):
+    diff = Inventory("user").review_version_changes()
+    assert diff.select("name", "change").rows() == [
+        ("added", "added"),
+        ("edited", "changed"),
+        ("removed", "removed"),
+    ]
+    assert diff.columns == [
+        "name",
+        "change",
+        "default_branch_from",
+        "default_branch_to",
+        "stars_from",
+        "stars_to",
+        "description_from",
+        "description_to",
+    ]
+    edited = diff.filter(name="edited")
+    assert edited.select("description_from", "description_to").row(0) == ("old", "new")
+
+
+def test_same_version_has_no_changes(cached):
+    assert Inventory("user").review_version_changes("first", "first").is_empty()
+
+
+def test_lazy_returns_lazyframe(cached):
+    assert isinstance(
+        Inventory("user", lazy=True).review_version_changes(),
+        pl.LazyFrame,
+    )
+
+
+def test_unknown_version_raises(cached):
+    with pytest.raises(ValueError, match="Unknown version"):
+        Inventory("user").review_version_changes("v1")